@@ -541,10 +541,16 @@ def print_uncaught_error(error: UncaughtError, detailed: bool, options: Options)
 async def command_slack_debug(buffer: str, args: List[str], options: Options):
     # TODO: Add message info (message_json)
     if args[0] == "tasks":
-        weechat.prnt("", "Active tasks:")
-        weechat.prnt("", pprint.pformat(shared.active_tasks))
-        weechat.prnt("", "Active futures:")
-        weechat.prnt("", pprint.pformat(shared.active_futures))
+        weechat.prnt("", "Active futures and the tasks waiting for them:")
+        weechat.prnt(
+            "",
+            pprint.pformat(
+                {
+                    future: future.waiting_tasks
+                    for future in shared.active_futures.values()
+                }
+            ),
+        )
     elif args[0] == "buffer":
         slack_buffer = shared.buffers.get(buffer)
         if isinstance(slack_buffer, SlackConversation):
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Callable, Optional
 
 import weechat
 
-from slack.log import print_error
+from slack.log import LogLevel, print_error, set_min_log_level
 from slack.shared import shared
 from slack.slack_conversation import invalidate_nicklists, update_buffer_props
 from slack.slack_workspace import SlackWorkspace
@@ -190,6 +190,17 @@ class SlackConfigSectionLook:
             string_values=["prefix", "all", "none"],
         )
 
+        self.debug_log_level: WeeChatOption[Literal["trace", "debug", "info"]] = (
+            WeeChatOption(
+                self._section,
+                "debug_log_level",
+                "minimum level of messages to keep for the debug buffer (/slack debug open_buffer); messages below this level are discarded, so set it to trace to include the verbose http and websocket messages",
+                "debug",
+                string_values=["trace", "debug", "info"],
+                callback_change=self.config_change_debug_log_level_cb,
+            )
+        )
+
         self.display_link_previews = WeeChatOption(
             self._section,
             "display_link_previews",
@@ -297,6 +308,14 @@ class SlackConfigSectionLook:
     ):
         invalidate_nicklists()
 
+    def config_change_debug_log_level_cb(
+        self, option: WeeChatOption[WeeChatOptionType], parent_changed: bool
+    ):
+        self.update_min_log_level()
+
+    def update_min_log_level(self):
+        set_min_log_level(LogLevel[self.debug_log_level.value.upper()])
+
     def config_change_nick_colors_cb(self, data: str, option: str, value: str):
         invalidate_nicklists()
         return weechat.WEECHAT_RC_OK
@@ -468,6 +487,7 @@ class SlackConfig:
 
     def config_read(self):
         weechat.config_read(self.weechat_config.pointer)
+        self.look.update_min_log_level()
 
     def create_workspace_config(self, workspace_name: str):
         if workspace_name in shared.workspaces:
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import os
 import resource
-from io import StringIO
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import weechat
 
@@ -12,11 +11,15 @@ from slack.log import DebugMessageType, LogLevel, log
 from slack.task import FutureProcess, FutureUrl, sleep, weechat_task_cb
 from slack.util import get_callback_name
 
+# The soft limit is the one enforced when opening new file descriptors
+MAX_FILE_DESCRIPTORS = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+MAX_RATELIMIT_RETRIES = 10
+
 
 def available_file_descriptors():
-    num_current_file_descriptors = len(os.listdir("/proc/self/fd/"))
-    max_file_descriptors = min(resource.getrlimit(resource.RLIMIT_NOFILE))
-    return max_file_descriptors - num_current_file_descriptors
+    with os.scandir("/proc/self/fd/") as entries:
+        num_current_file_descriptors = sum(1 for _ in entries)
+    return MAX_FILE_DESCRIPTORS - num_current_file_descriptors
 
 
 async def hook_process_hashtable(
@@ -26,7 +29,7 @@ async def hook_process_hashtable(
     log(
         LogLevel.DEBUG,
         DebugMessageType.LOG,
-        f"hook_process_hashtable calling ({future.id}): command: {command}",
+        lambda: f"hook_process_hashtable calling ({future.id}): command: {command}",
     )
     while available_file_descriptors() < 10:
         await sleep(100)
@@ -34,8 +37,8 @@ async def hook_process_hashtable(
         command, options, timeout, get_callback_name(weechat_task_cb), future.id
     )
 
-    stdout = StringIO()
-    stderr = StringIO()
+    stdout: List[str] = []
+    stderr: List[str] = []
     return_code = -1
 
     while return_code == -1:
@@ -44,17 +47,17 @@ async def hook_process_hashtable(
         log(
             LogLevel.TRACE,
             DebugMessageType.LOG,
-            f"hook_process_hashtable intermediary response ({next_future.id}): command: {command}",
+            lambda: f"hook_process_hashtable intermediary response ({next_future.id}): command: {command}",
         )
-        stdout.write(out)
-        stderr.write(err)
+        stdout.append(out)
+        stderr.append(err)
 
-    out = stdout.getvalue()
-    err = stderr.getvalue().strip()
+    out = "".join(stdout)
+    err = "".join(stderr).strip()
     log(
         LogLevel.DEBUG,
         DebugMessageType.LOG,
-        f"hook_process_hashtable response ({future.id}): command: {command}, "
+        lambda: f"hook_process_hashtable response ({future.id}): command: {command}, "
         f"return_code: {return_code}, response length: {len(out)}"
         + (f", error: {err}" if err else ""),
     )
@@ -83,9 +86,17 @@ async def http_request_process(
     if return_code != 0 or err:
         raise HttpError(url, options, return_code, None, err)
 
-    parts = out.split("\r\n\r\nHTTP/")
-    headers, body = parts[-1].split("\r\n\r\n", 1)
-    http_status = int(headers.split(None, 2)[1])
+    headers_start = 0
+    headers_end = out.index("\r\n\r\n")
+    # Skip past the headers of any preceding responses (e.g. from a proxy)
+    # without scanning the body, which may be large
+    while out.startswith("HTTP/", headers_end + 4):
+        headers_start = headers_end + len("\r\n\r\nHTTP/")
+        headers_end = out.index("\r\n\r\n", headers_start)
+    headers = out[headers_start:headers_end]
+    body = out[headers_end + 4 :]
+    status_start = headers.index(" ") + 1
+    http_status = int(headers[status_start : status_start + 3])
     return http_status, headers, body
 
 
@@ -111,48 +122,59 @@ async def http_request_url(
     return http_status, header_parts[-1], output["output"]
 
 
+def get_retry_after(headers: str) -> Optional[int]:
+    header_lines = headers.split("\r\n")
+    for header in header_lines[1:]:
+        if header[:12].lower() == "retry-after:":
+            return int(header[12:].strip())
+
+
 async def http_request(
     url: str, options: Dict[str, str], timeout: int, max_retries: int = 5
 ) -> str:
-    log(
-        LogLevel.DEBUG,
-        DebugMessageType.HTTP_REQUEST,
-        f"requesting: {url}, {options.get('postfields')}",
-    )
-    try:
-        if hasattr(weechat, "hook_url"):
-            http_status, headers, body = await http_request_url(url, options, timeout)
-        else:
-            http_status, headers, body = await http_request_process(
-                url, options, timeout
-            )
-    except HttpError as e:
-        if max_retries > 0:
-            log(
-                LogLevel.INFO,
-                DebugMessageType.LOG,
-                f"HTTP error, retrying (max {max_retries} times): "
-                f"return_code: {e.return_code}, error: {e.error}, url: {url}",
-            )
-            await sleep(1000)
-            return await http_request(url, options, timeout, max_retries - 1)
-        raise
-
-    if http_status == 429:
-        header_lines = headers.split("\r\n")
-        for header in header_lines[1:]:
-            name, value = header.split(":", 1)
-            if name.lower() == "retry-after":
-                retry_after = int(value.strip())
+    retries_left = max_retries
+    ratelimit_retries_left = MAX_RATELIMIT_RETRIES
+    while True:
+        log(
+            LogLevel.DEBUG,
+            DebugMessageType.HTTP_REQUEST,
+            lambda: f"requesting: {url}, {options.get('postfields')}",
+        )
+        try:
+            if hasattr(weechat, "hook_url"):
+                http_status, headers, body = await http_request_url(
+                    url, options, timeout
+                )
+            else:
+                http_status, headers, body = await http_request_process(
+                    url, options, timeout
+                )
+        except HttpError as e:
+            if retries_left > 0:
+                log(
+                    LogLevel.INFO,
+                    DebugMessageType.LOG,
+                    f"HTTP error, retrying (max {retries_left} times): "
+                    f"return_code: {e.return_code}, error: {e.error}, url: {url}",
+                )
+                retries_left -= 1
+                await sleep(1000)
+                continue
+            raise
+
+        if http_status == 429 and ratelimit_retries_left > 0:
+            retry_after = get_retry_after(headers)
+            if retry_after is not None:
                 log(
                     LogLevel.INFO,
                     DebugMessageType.LOG,
                     f"HTTP ratelimit, retrying in {retry_after} seconds, url: {url}",
                 )
+                ratelimit_retries_left -= 1
                 await sleep(retry_after * 1000)
-                return await http_request(url, options, timeout)
+                continue
 
-    if http_status >= 400:
-        raise HttpError(url, options, None, http_status, body)
+        if http_status >= 400:
+            raise HttpError(url, options, None, http_status, body)
 
-    return body
+        return body
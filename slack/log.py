@@ -3,7 +3,7 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import List, Set
+from typing import Callable, List, Set, Union
 
 import weechat
 
@@ -37,9 +37,17 @@ class DebugMessage:
 
 
 debug_messages: List[DebugMessage] = []
+# Messages below this level are dropped, and lazy (callable) messages are
+# not evaluated for them
+min_log_level = LogLevel.DEBUG
 printed_exceptions: Set[BaseException] = set()
 
 
+def set_min_log_level(level: LogLevel):
+    global min_log_level
+    min_log_level = level
+
+
 # TODO: Figure out what to do with print_error vs log
 def print_error(message: str):
     weechat.prnt("", f"{weechat.prefix('error')}{shared.SCRIPT_NAME}: {message}")
@@ -51,7 +59,16 @@ def print_exception_once(e: BaseException):
         printed_exceptions.add(e)
 
 
-def log(level: LogLevel, message_type: DebugMessageType, message: str):
+def log(
+    level: LogLevel,
+    message_type: DebugMessageType,
+    message: Union[str, Callable[[], str]],
+):
+    if level < min_log_level:
+        return
+    if callable(message):
+        message = message()
+
     if level >= LogLevel.INFO:
         prefix = weechat.prefix("error") if level >= LogLevel.ERROR else "\t"
         weechat.prnt("", f"{prefix}{shared.SCRIPT_NAME} {level.name}: {message}")
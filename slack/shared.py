@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
 
 if TYPE_CHECKING:
@@ -11,7 +10,7 @@ if TYPE_CHECKING:
     from slack.slack_emoji import Emoji
     from slack.slack_search_buffer import SearchType, SlackSearchBuffer
     from slack.slack_workspace import SlackWorkspace
-    from slack.task import Future, Task
+    from slack.task import Future
 
 WeechatCallbackReturnType = Union[int, str, Dict[str, str], None]
 
@@ -34,7 +33,6 @@ class Shared:
 
         self.weechat_version: int
         self.weechat_callbacks: Dict[str, Callable[..., WeechatCallbackReturnType]]
-        self.active_tasks: Dict[str, List[Task[object]]] = defaultdict(list)
         self.active_futures: Dict[str, Future[object]] = {}
         self.buffers: Dict[str, SlackBuffer] = {}
         self.search_buffers: Dict[SearchType, SlackSearchBuffer] = {}
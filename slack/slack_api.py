@@ -4,10 +4,20 @@ import json
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
     Iterable,
+    List,
     Mapping,
     Optional,
     Sequence,
+    Set,
+    Tuple,
+    TypeVar,
     Union,
 )
 from urllib.parse import urlencode
@@ -16,11 +26,16 @@ from slack.error import HttpError, SlackApiError
 from slack.http import http_request
 from slack.shared import shared
 from slack.slack_message import SlackTs
-from slack.task import gather
+from slack.task import Task, create_task, gather, sleep
 from slack.util import chunked, get_cookies
 
 if TYPE_CHECKING:
-    from slack_api.slack_bots_info import SlackBotInfoResponse, SlackBotsInfoResponse
+    from slack_api.slack_bots_info import (
+        SlackBotInfoResponse,
+        SlackBotInfoSuccessResponse,
+        SlackBotsInfoResponse,
+        SlackBotsInfoSuccessResponse,
+    )
     from slack_api.slack_client_counts import SlackClientCountsResponse
     from slack_api.slack_client_userboot import SlackClientUserbootResponse
     from slack_api.slack_common import SlackGenericResponse
@@ -41,6 +56,7 @@ if TYPE_CHECKING:
     from slack_api.slack_users_info import (
         SlackUserInfo,
         SlackUserInfoResponse,
+        SlackUserInfoSuccessResponse,
         SlackUsersInfoResponse,
         SlackUsersInfoSuccessResponse,
     )
@@ -53,22 +69,76 @@ if TYPE_CHECKING:
     from slack.slack_conversation import SlackConversation
     from slack.slack_workspace import SlackWorkspace
 
+T = TypeVar("T")
+
+SLACK_API_URL = "https://api.slack.com/api/"
+# The bots.info method accepts at most this many bot ids per request
+MAX_BOTS_PER_FETCH_REQUEST = 30
+
 Params = Mapping[str, Union[str, int, bool]]
 EdgeParams = Mapping[
     str, Union[str, int, bool, Sequence[str], Sequence[int], Sequence[bool]]
 ]
 
 
+class SlackInfoBatch(Generic[T]):
+    """Combines concurrent lookups of single items into one request"""
+
+    def __init__(self, fetch_items: Callable[[Iterable[str]], Awaitable[Dict[str, T]]]):
+        self._fetch_items = fetch_items
+        self._pending: Optional[Tuple[Set[str], Task[Dict[str, T]]]] = None
+
+    async def get(self, item_id: str) -> Optional[T]:
+        if self._pending is None:
+            item_ids: Set[str] = set()
+            self._pending = (item_ids, create_task(self._fetch_pending(item_ids)))
+        item_ids, task = self._pending
+        item_ids.add(item_id)
+        items = await task
+        return items.get(item_id)
+
+    async def _fetch_pending(self, item_ids: Set[str]) -> Dict[str, T]:
+        # Wait until the current callback is done, so lookups started by it
+        # are included in the same request
+        await sleep(1)
+        self._pending = None
+        # A single lookup is done separately by the caller, so it gets the
+        # error for its own item if it fails
+        if len(item_ids) == 1:
+            return {}
+        try:
+            return await self._fetch_items(item_ids)
+        except SlackApiError:
+            # An unknown item makes the whole request fail, so let each
+            # lookup fall back to fetching its own item separately. HTTP errors
+            # are not caught, since http_request has already retried them.
+            return {}
+
+
 class SlackApiCommon:
     def __init__(self, workspace: SlackWorkspace):
         self.workspace = workspace
-
-    def _get_request_options(self):
-        return {
-            "useragent": f"wee_slack {shared.SCRIPT_VERSION}",
-            "httpheader": f"Authorization: Bearer {self.workspace.config.api_token.value}",
-            "cookie": get_cookies(self.workspace.config.api_cookies.value),
-        }
+        self._request_options_key: Optional[Tuple[str, str]] = None
+        self._request_options: Dict[str, str] = {}
+        self._json_request_options: Dict[str, str] = {}
+
+    def _get_request_options(self, json_body: bool = False) -> Dict[str, str]:
+        # The returned dict is shared between requests, so it must not be modified
+        token = self.workspace.config.api_token.value
+        cookies = self.workspace.config.api_cookies.value
+        if self._request_options_key != (token, cookies):
+            self._request_options_key = (token, cookies)
+            self._request_options = {
+                "useragent": f"wee_slack {shared.SCRIPT_VERSION}",
+                "httpheader": f"Authorization: Bearer {token}",
+                "cookie": get_cookies(cookies),
+            }
+            self._json_request_options = {
+                **self._request_options,
+                "httpheader": f"Authorization: Bearer {token}"
+                "\nContent-Type: application/json",
+            }
+        return self._json_request_options if json_body else self._request_options
 
 
 class SlackEdgeApi(SlackApiCommon):
@@ -79,9 +149,10 @@ class SlackEdgeApi(SlackApiCommon):
     async def _fetch_edgeapi(self, method: str, params: EdgeParams = {}):
         id_for_path = self.workspace.enterprise_id or self.workspace.id
         url = f"https://edgeapi.slack.com/cache/{id_for_path}/{method}"
-        options = self._get_request_options()
-        options["postfields"] = json.dumps(params)
-        options["httpheader"] += "\nContent-Type: application/json"
+        options = {
+            **self._get_request_options(json_body=True),
+            "postfields": json.dumps(params),
+        }
         response = await http_request(
             url,
             options,
@@ -137,11 +208,12 @@ class SlackApi(SlackApiCommon):
     def __init__(self, workspace: SlackWorkspace):
         super().__init__(workspace)
         self.edgeapi = SlackEdgeApi(workspace)
+        self._user_info_batch = SlackInfoBatch(self._fetch_users_info_by_id)
+        self._bot_info_batch = SlackInfoBatch(self._fetch_bots_info_by_id)
 
     async def _fetch(self, method: str, params: Params = {}):
-        url = f"https://api.slack.com/api/{method}"
-        options = self._get_request_options()
-        options["postfields"] = urlencode(params)
+        url = SLACK_API_URL + method
+        options = {**self._get_request_options(), "postfields": urlencode(params)}
         response = await http_request(
             url,
             options,
@@ -149,6 +221,29 @@ class SlackApi(SlackApiCommon):
         )
         return json.loads(response)
 
+    async def _iter_list(
+        self,
+        method: str,
+        params: Params = {},
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        remaining = limit
+        page_params = params
+        while True:
+            cur_limit = 1000 if remaining is None or remaining > 1000 else remaining
+            response = await self._fetch(method, {**page_params, "limit": cur_limit})
+            yield response
+            if not response["ok"]:
+                return
+            if remaining is not None:
+                remaining -= cur_limit
+                if remaining <= 0:
+                    return
+            next_cursor = response.get("response_metadata", {}).get("next_cursor")
+            if not next_cursor:
+                return
+            page_params = {**params, "cursor": next_cursor}
+
     async def _fetch_list(
         self,
         method: str,
@@ -156,22 +251,24 @@ class SlackApi(SlackApiCommon):
         params: Params = {},
         limit: Optional[int] = None,
     ):
-        cur_limit = 1000 if limit is None or limit > 1000 else limit
-        response = await self._fetch(method, {**params, "limit": cur_limit})
-        remaining = limit - cur_limit if limit is not None else None
-        next_cursor = response.get("response_metadata", {}).get("next_cursor")
-        if (remaining is None or remaining > 0) and next_cursor and response["ok"]:
-            new_params = {**params, "cursor": next_cursor}
-            next_pages = await self._fetch_list(method, list_key, new_params, remaining)
-            response[list_key].extend(next_pages[list_key])
-            return response
-        return response
+        first_page: Any = None
+        page_items: List[List[Any]] = []
+        async for response in self._iter_list(method, params, limit):
+            if not response["ok"]:
+                return response
+            if first_page is None:
+                first_page = response
+            page_items.append(response[list_key])
+        if len(page_items) > 1:
+            first_page[list_key] = list(chain.from_iterable(page_items))
+        return first_page
 
     async def _post(self, method: str, body: Mapping[str, object]):
-        url = f"https://api.slack.com/api/{method}"
-        options = self._get_request_options()
-        options["httpheader"] += "\nContent-Type: application/json"
-        options["postfields"] = json.dumps(body)
+        url = SLACK_API_URL + method
+        options = {
+            **self._get_request_options(json_body=True),
+            "postfields": json.dumps(body),
+        }
         response = await http_request(
             url,
             options,
@@ -279,28 +376,31 @@ class SlackApi(SlackApiCommon):
             raise SlackApiError(self.workspace, method, response, params)
         return response
 
-    async def fetch_users_conversations(
+    async def iter_users_conversations(
         self,
         types: str,
         exclude_archived: bool = True,
-        limit: Optional[int] = None,
     ):
         method = "users.conversations"
         params: Params = {
             "types": types,
             "exclude_archived": exclude_archived,
         }
-        response: SlackUsersConversationsResponse = await self._fetch_list(
-            method,
-            "channels",
-            params,
-            limit,
-        )
-        if response["ok"] is False:
-            raise SlackApiError(self.workspace, method, response, params)
-        return response
+        async for page in self._iter_list(method, params):
+            response: SlackUsersConversationsResponse = page
+            if response["ok"] is False:
+                raise SlackApiError(self.workspace, method, response, params)
+            yield response
 
     async def fetch_user_info(self, user_id: str):
+        user_info = await self._user_info_batch.get(user_id)
+        if user_info is not None:
+            batched_response: SlackUserInfoSuccessResponse[SlackUserInfo] = {
+                "ok": True,
+                "user": user_info,
+            }
+            return batched_response
+
         method = "users.info"
         params: Params = {"user": user_id}
         response: SlackUserInfoResponse = await self._fetch(method, params)
@@ -353,7 +453,19 @@ class SlackApi(SlackApiCommon):
         response: SlackUsersInfoResponse = {"ok": True, "users": users}
         return response
 
+    async def _fetch_users_info_by_id(self, user_ids: Iterable[str]):
+        response = await self.fetch_users_info(user_ids)
+        return {info["id"]: info for info in response["users"]}
+
     async def fetch_bot_info(self, bot_id: str):
+        bot_info = await self._bot_info_batch.get(bot_id)
+        if bot_info is not None:
+            batched_response: SlackBotInfoSuccessResponse = {
+                "ok": True,
+                "bot": bot_info,
+            }
+            return batched_response
+
         method = "bots.info"
         params: Params = {"bot": bot_id}
         response: SlackBotInfoResponse = await self._fetch(method, params)
@@ -361,7 +473,7 @@ class SlackApi(SlackApiCommon):
             raise SlackApiError(self.workspace, method, response, params)
         return response
 
-    async def fetch_bots_info(self, bot_ids: Iterable[str]):
+    async def _fetch_bots_info_without_splitting(self, bot_ids: Iterable[str]):
         method = "bots.info"
         params: Params = {"bots": ",".join(bot_ids)}
         response: SlackBotsInfoResponse = await self._fetch(method, params)
@@ -369,6 +481,23 @@ class SlackApi(SlackApiCommon):
             raise SlackApiError(self.workspace, method, response, params)
         return response
 
+    async def fetch_bots_info(
+        self, bot_ids: Iterable[str]
+    ) -> SlackBotsInfoSuccessResponse:
+        responses = await gather(
+            *(
+                self._fetch_bots_info_without_splitting(bot_ids_batch)
+                for bot_ids_batch in chunked(bot_ids, MAX_BOTS_PER_FETCH_REQUEST)
+            )
+        )
+        bots = list(chain(*(response["bots"] for response in responses)))
+        response: SlackBotsInfoSuccessResponse = {"ok": True, "bots": bots}
+        return response
+
+    async def _fetch_bots_info_by_id(self, bot_ids: Iterable[str]):
+        response = await self.fetch_bots_info(bot_ids)
+        return {info["id"]: info for info in response["bots"]}
+
     async def fetch_usergroups_list(self, include_users: bool):
         method = "usergroups.list"
         params: Params = {"include_users": include_users}
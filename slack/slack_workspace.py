@@ -333,18 +333,7 @@ class SlackWorkspace:
             if self.my_user.id in u.get("users", [])
         )
 
-        users_conversations_response = await self.api.fetch_users_conversations(
-            "public_channel,private_channel,mpim,im"
-        )
-        channels = users_conversations_response["channels"]
-        self.conversations.initialize_items(channel["id"] for channel in channels)
-
-        conversations_if_should_open = await gather(
-            *(self._conversation_if_should_open(channel) for channel in channels)
-        )
-        conversations_to_open = [
-            c for c in conversations_if_should_open if c is not None
-        ]
+        conversations_to_open = await self._fetch_conversations_to_open()
 
         # Load the first 1000 chanels to be able to look them up by name, since
         # we can't look up a channel id from channel name with OAuth tokens
@@ -356,6 +345,31 @@ class SlackWorkspace:
 
         return conversations_to_open
 
+    async def _fetch_conversations_to_open(self) -> List[SlackConversation]:
+        # Start initializing the conversations of each page while the next
+        # page is being fetched
+        conversation_if_should_open_tasks: List[Task[Optional[SlackConversation]]] = []
+        try:
+            async for users_conversations_response in self.api.iter_users_conversations(
+                "public_channel,private_channel,mpim,im"
+            ):
+                channels = users_conversations_response["channels"]
+                self.conversations.initialize_items(
+                    channel["id"] for channel in channels
+                )
+                conversation_if_should_open_tasks.extend(
+                    create_task(self._conversation_if_should_open(channel))
+                    for channel in channels
+                )
+        except Exception:
+            # Await the tasks already started, so their errors aren't reported
+            # as never awaited on top of this error
+            await gather(*conversation_if_should_open_tasks, return_exceptions=True)
+            raise
+
+        conversations_if_should_open = await gather(*conversation_if_should_open_tasks)
+        return [c for c in conversations_if_should_open if c is not None]
+
     async def _initialize_session(self) -> List[SlackConversation]:
         user_boot_task = create_task(self.api.fetch_client_userboot())
         client_counts_task = create_task(self.api.fetch_client_counts())
@@ -528,7 +542,7 @@ class SlackWorkspace:
 
     async def ws_recv(self, data: SlackRtmMessage):
         # TODO: Remove old messages
-        log(LogLevel.DEBUG, DebugMessageType.WEBSOCKET_RECV, json.dumps(data))
+        log(LogLevel.DEBUG, DebugMessageType.WEBSOCKET_RECV, lambda: json.dumps(data))
 
         try:
             if data["type"] == "hello":
@@ -623,7 +637,7 @@ class SlackWorkspace:
                     log(
                         LogLevel.DEBUG,
                         DebugMessageType.LOG,
-                        f"unknown websocket message type (without channel): {data.get('type')}",
+                        lambda: f"unknown websocket message type (without channel): {data.get('type')}",
                     )
                 return
 
@@ -718,7 +732,7 @@ class SlackWorkspace:
                 log(
                     LogLevel.DEBUG,
                     DebugMessageType.LOG,
-                    f"unknown websocket message type (with channel): {data.get('type')}",
+                    lambda: f"unknown websocket message type (with channel): {data.get('type')}",
                 )
         except Exception as e:
             slack_error = SlackRtmError(self, e, data)
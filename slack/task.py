@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from itertools import count
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -17,7 +18,6 @@ from typing import (
     Union,
     overload,
 )
-from uuid import uuid4
 
 import weechat
 
@@ -33,6 +33,7 @@ T = TypeVar("T")
 
 running_tasks: Set[Task[object]] = set()
 failed_tasks: List[Tuple[Task[object], BaseException]] = []
+future_ids = count(1)
 
 
 class CancelledError(Exception):
@@ -45,14 +46,26 @@ class InvalidStateError(Exception):
 
 # Heavily inspired by https://github.com/python/cpython/blob/3.11/Lib/asyncio/futures.py
 class Future(Awaitable[T]):
+    __slots__ = (
+        "id",
+        "_state",
+        "_result",
+        "_exception",
+        "_cancel_message",
+        "_callbacks",
+        "_exception_read",
+        "waiting_tasks",
+    )
+
     def __init__(self, future_id: Optional[str] = None):
-        self.id = future_id or str(uuid4())
+        self.id = future_id or str(next(future_ids))
         self._state: Literal["PENDING", "CANCELLED", "FINISHED"] = "PENDING"
         self._result: T
         self._exception: Optional[BaseException] = None
         self._cancel_message = None
         self._callbacks: List[Callable[[Self], object]] = []
         self._exception_read = False
+        self.waiting_tasks: List[Task[Any]] = []
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}('{self.id}')"
@@ -149,18 +162,20 @@ class Future(Awaitable[T]):
 
 
 class FutureProcess(Future[Tuple[str, int, str, str]]):
-    pass
+    __slots__ = ()
 
 
 class FutureUrl(Future[Tuple[str, Dict[str, str], Dict[str, str]]]):
-    pass
+    __slots__ = ()
 
 
 class FutureTimer(Future[Tuple[int]]):
-    pass
+    __slots__ = ()
 
 
 class Task(Future[T]):
+    __slots__ = ("coroutine",)
+
     def __init__(self, coroutine: Coroutine[Future[T], None, T]):
         super().__init__()
         self.coroutine = coroutine
@@ -172,25 +187,31 @@ class Task(Future[T]):
         if not super().cancel(msg):
             return False
         self.coroutine.close()
+        # Tasks waiting for a cancelled task are never resumed, so don't keep
+        # them, or the task, around. Otherwise shared.active_futures would never
+        # become empty and failed_tasks would never be reported and cleared.
+        shared.active_futures.pop(self.id, None)
+        self.waiting_tasks = []
         return True
 
 
+def run_waiting_tasks(future: Future[Any]):
+    tasks = future.waiting_tasks
+    future.waiting_tasks = []
+    for task in tasks:
+        task_runner(task)
+
+
 def weechat_task_cb(data: str, *args: object) -> int:
     future = shared.active_futures.pop(data)
     future.set_result(args)
-    tasks = shared.active_tasks.pop(data)
-    for task in tasks:
-        task_runner(task)
+    run_waiting_tasks(future)
     return weechat.WEECHAT_RC_OK
 
 
 def process_ended_task(task: Task[Any]):
-    if task.id in shared.active_tasks:
-        tasks = shared.active_tasks.pop(task.id)
-        for active_task in tasks:
-            task_runner(active_task)
-    if task.id in shared.active_futures:
-        del shared.active_futures[task.id]
+    shared.active_futures.pop(task.id, None)
+    run_waiting_tasks(task)
 
 
 def task_runner(task: Task[Any]):
@@ -210,12 +231,12 @@ def task_runner(task: Task[Any]):
             break
 
         if not future.done():
-            shared.active_tasks[future.id].append(task)
+            future.waiting_tasks.append(task)
             shared.active_futures[future.id] = future
             break
 
     running_tasks.remove(task)
-    if not running_tasks and not shared.active_tasks:
+    if not running_tasks and not shared.active_futures:
         for task, exception in failed_tasks:
             if not task.exception_read():
                 print_error(
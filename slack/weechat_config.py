@@ -56,17 +56,20 @@ WeeChatOptionTypes = Union[int, str]
 WeeChatOptionType = TypeVar("WeeChatOptionType", bound=WeeChatOptionTypes)
 
 
-def option_get_value(
-    option_pointer: str, option_type: WeeChatOptionType
-) -> WeeChatOptionType:
+def option_value_getter(
+    option_type: WeeChatOptionType,
+) -> Callable[[str], WeeChatOptionType]:
     if isinstance(option_type, bool):
-        return cast(WeeChatOptionType, weechat.config_boolean(option_pointer) == 1)
+        return lambda pointer: cast(
+            WeeChatOptionType, weechat.config_boolean(pointer) == 1
+        )
     if isinstance(option_type, int):
-        return cast(WeeChatOptionType, weechat.config_integer(option_pointer))
+        return lambda pointer: cast(WeeChatOptionType, weechat.config_integer(pointer))
     if isinstance(option_type, WeeChatColor):
-        color = weechat.config_color(option_pointer)
-        return cast(WeeChatOptionType, WeeChatColor(color))
-    return cast(WeeChatOptionType, weechat.config_string(option_pointer))
+        return lambda pointer: cast(
+            WeeChatOptionType, WeeChatColor(weechat.config_color(pointer))
+        )
+    return lambda pointer: cast(WeeChatOptionType, weechat.config_string(pointer))
 
 
 @dataclass
@@ -85,6 +88,8 @@ class WeeChatOption(Generic[WeeChatOptionType]):
     evaluate_func: Optional[Callable[[WeeChatOptionType], WeeChatOptionType]] = None
 
     def __post_init__(self):
+        # Resolve how to read the value once, since options are read often
+        self._get_value = option_value_getter(self.default_value)
         self._pointer = self._create_weechat_option()
 
     def __bool__(self) -> bool:
@@ -94,11 +99,11 @@ class WeeChatOption(Generic[WeeChatOptionType]):
         if weechat.config_option_is_null(self._pointer):
             if isinstance(self.parent_option, str):
                 parent_option_pointer = weechat.config_get(self.parent_option)
-                return option_get_value(parent_option_pointer, self.default_value)
+                return self._get_value(parent_option_pointer)
             elif self.parent_option is not None:
                 return self.parent_option._raw_value()
             return self.default_value
-        return option_get_value(self._pointer, self.default_value)
+        return self._get_value(self._pointer)
 
     @property
     def value(self) -> WeeChatOptionType:
@@ -290,3 +290,66 @@ def test_http_request_ratelimit(mock_method: MagicMock):
     with pytest.raises(StopIteration) as excinfo:
         coroutine.send(None)
     assert excinfo.value.value == "response"
+
+
+def test_http_request_process_body_containing_headers_separator():
+    url = "http://example.com"
+    coroutine = http_request_process(url, {}, 0)
+    future = coroutine.send(None)
+    assert isinstance(future, FutureProcess)
+
+    body = "HTTP/2 200\r\n\r\nresponse\r\n\r\nHTTP/1.1 404\r\n\r\nresponse"
+    future.set_result(("", 0, body, ""))
+
+    with pytest.raises(StopIteration) as excinfo:
+        coroutine.send(future)
+    assert excinfo.value.value == (
+        200,
+        "HTTP/2 200",
+        "response\r\n\r\nHTTP/1.1 404\r\n\r\nresponse",
+    )
+
+
+@patch.object(weechat, "hook_timer")
+def test_http_request_ratelimit_max_retries(mock_method: MagicMock):
+    url = "http://example.com"
+    coroutine = http_request(url, {}, 0)
+
+    for _ in range(10):
+        future_url = coroutine.send(None)
+        assert isinstance(future_url, FutureUrl)
+        future_url.set_result(
+            (
+                url,
+                {},
+                {
+                    "response_code": "429",
+                    "headers": "HTTP/2 429\r\nRetry-After: 1",
+                    "output": "response",
+                },
+            )
+        )
+
+        future_timer = coroutine.send(None)
+        assert isinstance(future_timer, FutureTimer)
+        future_timer.set_result((0,))
+
+    future_url = coroutine.send(None)
+    assert isinstance(future_url, FutureUrl)
+    future_url.set_result(
+        (
+            url,
+            {},
+            {
+                "response_code": "429",
+                "headers": "HTTP/2 429\r\nRetry-After: 1",
+                "output": "response",
+            },
+        )
+    )
+
+    with pytest.raises(HttpError) as excinfo:
+        coroutine.send(None)
+
+    assert excinfo.value.http_status_code == 429
+    assert mock_method.call_count == 10
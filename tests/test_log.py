@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import List
+
+import slack.log
+from slack.log import DebugMessageType, LogLevel, log, set_min_log_level
+
+
+def test_log_evaluates_message_only_at_or_above_min_log_level():
+    evaluated: List[LogLevel] = []
+
+    def message_for(level: LogLevel):
+        def message():
+            evaluated.append(level)
+            return level.name
+
+        return message
+
+    previous_level = slack.log.min_log_level
+    debug_messages_count = len(slack.log.debug_messages)
+    try:
+        set_min_log_level(LogLevel.DEBUG)
+        for level in (LogLevel.TRACE, LogLevel.DEBUG):
+            log(level, DebugMessageType.LOG, message_for(level))
+        assert evaluated == [LogLevel.DEBUG]
+
+        set_min_log_level(LogLevel.TRACE)
+        log(LogLevel.TRACE, DebugMessageType.LOG, message_for(LogLevel.TRACE))
+        assert evaluated == [LogLevel.DEBUG, LogLevel.TRACE]
+    finally:
+        set_min_log_level(previous_level)
+        del slack.log.debug_messages[debug_messages_count:]
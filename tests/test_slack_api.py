@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from itertools import chain
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+import weechat
+
+import slack.task
+from slack.error import HttpError, SlackApiError
+from slack.shared import shared
+from slack.slack_workspace import SlackWorkspace
+from slack.task import create_task, weechat_task_cb
+from tests.conftest import (
+    channel_public_id,
+    user_test1_id,
+    user_test1_info,
+    user_test2_id,
+    user_test2_info,
+)
+
+if TYPE_CHECKING:
+    from slack_api.slack_users_info import SlackUsersInfoResponse
+
+
+@patch.object(weechat, "hook_timer")
+def test_fetch_user_info_batches_concurrent_lookups(
+    mock_hook_timer: MagicMock, workspace: SlackWorkspace
+):
+    shared.active_futures = {}
+    fetched_user_ids: List[List[str]] = []
+
+    async def fetch_users_info(user_ids: Iterable[str]):
+        fetched_user_ids.append(sorted(user_ids))
+        response: SlackUsersInfoResponse = {
+            "ok": True,
+            "users": [user_test1_info, user_test2_info],
+        }
+        return response
+
+    with patch.object(workspace.api, "fetch_users_info", fetch_users_info):
+        task1 = create_task(workspace.api.fetch_user_info(user_test1_id))
+        task2 = create_task(workspace.api.fetch_user_info(user_test2_id))
+        mock_hook_timer.assert_called_once()
+        weechat_task_cb(mock_hook_timer.call_args[0][4], 0)
+
+    assert fetched_user_ids == [sorted([user_test1_id, user_test2_id])]
+    assert task1.result() == {"ok": True, "user": user_test1_info}
+    assert task2.result() == {"ok": True, "user": user_test2_info}
+
+
+@patch.object(weechat, "hook_timer")
+def test_fetch_user_info_falls_back_to_single_lookups_on_error(
+    mock_hook_timer: MagicMock, workspace: SlackWorkspace
+):
+    shared.active_futures = {}
+    fetched_user_ids: List[str] = []
+
+    async def fetch_users_info(user_ids: Iterable[str]):
+        raise SlackApiError(workspace, "users.info", {"ok": False, "error": "error"})
+
+    async def fetch(method: str, params: Dict[str, str]):
+        fetched_user_ids.append(params["user"])
+        return {"ok": True, "user": params["user"]}
+
+    with patch.object(workspace.api, "fetch_users_info", fetch_users_info):
+        with patch.object(workspace.api, "_fetch", fetch):
+            task1 = create_task(workspace.api.fetch_user_info(user_test1_id))
+            task2 = create_task(workspace.api.fetch_user_info(user_test2_id))
+            weechat_task_cb(mock_hook_timer.call_args[0][4], 0)
+
+    assert fetched_user_ids == [user_test1_id, user_test2_id]
+    assert task1.result() == {"ok": True, "user": user_test1_id}
+    assert task2.result() == {"ok": True, "user": user_test2_id}
+
+
+@patch.object(weechat, "hook_timer")
+def test_fetch_user_info_does_not_fall_back_on_http_error(
+    mock_hook_timer: MagicMock, workspace: SlackWorkspace
+):
+    shared.active_futures = {}
+    fetched_user_ids: List[str] = []
+
+    async def fetch_users_info(user_ids: Iterable[str]):
+        raise HttpError("url", {}, None, 500, "error")
+
+    async def fetch(method: str, params: Dict[str, str]):
+        fetched_user_ids.append(params["user"])
+        return {"ok": True, "user": params["user"]}
+
+    with patch.object(workspace.api, "fetch_users_info", fetch_users_info):
+        with patch.object(workspace.api, "_fetch", fetch):
+            task1 = create_task(workspace.api.fetch_user_info(user_test1_id))
+            task2 = create_task(workspace.api.fetch_user_info(user_test2_id))
+            weechat_task_cb(mock_hook_timer.call_args[0][4], 0)
+
+    assert not fetched_user_ids
+    for task in (task1, task2):
+        with pytest.raises(HttpError) as excinfo:
+            task.result()
+        assert excinfo.value.http_status_code == 500
+
+
+@patch.object(weechat, "hook_timer")
+def test_fetch_bot_info_splits_batches_larger_than_the_limit(
+    mock_hook_timer: MagicMock, workspace: SlackWorkspace
+):
+    shared.active_futures = {}
+    bot_ids = [f"B{i:02}" for i in range(65)]
+    fetched_bot_ids: List[List[str]] = []
+
+    async def fetch(method: str, params: Dict[str, str]):
+        ids = params["bots"].split(",")
+        fetched_bot_ids.append(ids)
+        return {"ok": True, "bots": [{"id": bot_id} for bot_id in ids]}
+
+    with patch.object(workspace.api, "_fetch", fetch):
+        tasks = [
+            create_task(workspace.api.fetch_bot_info(bot_id)) for bot_id in bot_ids
+        ]
+        weechat_task_cb(mock_hook_timer.call_args[0][4], 0)
+
+    assert sorted(len(ids) for ids in fetched_bot_ids) == [5, 30, 30]
+    assert sorted(chain.from_iterable(fetched_bot_ids)) == bot_ids
+    for bot_id, task in zip(bot_ids, tasks):
+        assert task.result() == {"ok": True, "bot": {"id": bot_id}}
+
+
+ratelimited_response = {"ok": False, "error": "ratelimited"}
+
+
+def paged_fetch(
+    key: str,
+    pages: List[Optional[List[object]]],
+    fetched_params: List[Dict[str, object]],
+):
+    """A _fetch stub returning one page of items per cursor, or a ratelimited
+    error for a page that is None"""
+
+    async def fetch(method: str, params: Dict[str, object]):
+        fetched_params.append(params)
+        cursor = str(params.get("cursor", ""))
+        index = int(cursor[1:]) if cursor else 0
+        items = pages[index]
+        if items is None:
+            return ratelimited_response
+        next_cursor = f"c{index + 1}" if index + 1 < len(pages) else ""
+        return {
+            "ok": True,
+            key: items,
+            "response_metadata": {"next_cursor": next_cursor},
+        }
+
+    return fetch
+
+
+def test_fetch_conversations_members_multiple_pages(workspace: SlackWorkspace):
+    shared.active_futures = {}
+    fetched_params: List[Dict[str, object]] = []
+    fetch = paged_fetch("members", [["U1", "U2"], ["U3"], ["U4"]], fetched_params)
+
+    conversation = workspace.conversations[channel_public_id].result()
+    with patch.object(workspace.api, "_fetch", fetch):
+        task = create_task(workspace.api.fetch_conversations_members(conversation))
+
+    assert task.result()["members"] == ["U1", "U2", "U3", "U4"]
+    assert [params.get("cursor") for params in fetched_params] == [None, "c1", "c2"]
+
+
+def test_fetch_conversations_members_stops_on_error(workspace: SlackWorkspace):
+    shared.active_futures = {}
+    fetched_params: List[Dict[str, object]] = []
+    fetch = paged_fetch("members", [["U1"], None, ["U2"]], fetched_params)
+
+    conversation = workspace.conversations[channel_public_id].result()
+    with patch.object(workspace.api, "_fetch", fetch):
+        task = create_task(workspace.api.fetch_conversations_members(conversation))
+
+    with pytest.raises(SlackApiError) as excinfo:
+        task.result()
+    assert excinfo.value.response == ratelimited_response
+    assert len(fetched_params) == 2
+
+
+def test_fetch_conversations_to_open_multiple_pages(workspace: SlackWorkspace):
+    shared.active_futures = {}
+    fetched_params: List[Dict[str, object]] = []
+    pages: List[Optional[List[object]]] = [
+        [{"id": channel_public_id, "page": page}] for page in range(3)
+    ]
+    fetch = paged_fetch("channels", pages, fetched_params)
+    conversation = workspace.conversations[channel_public_id].result()
+    opened_pages: List[object] = []
+
+    async def conversation_if_should_open(info: Dict[str, object]):
+        opened_pages.append(info["page"])
+        return conversation if info["page"] != 1 else None
+
+    with patch.object(workspace.api, "_fetch", fetch), patch.object(
+        workspace, "_conversation_if_should_open", conversation_if_should_open
+    ):
+        task = create_task(
+            workspace._fetch_conversations_to_open()  # pyright: ignore [reportPrivateUsage]
+        )
+
+    assert task.result() == [conversation, conversation]
+    assert opened_pages == [0, 1, 2]
+    assert [params.get("cursor") for params in fetched_params] == [None, "c1", "c2"]
+
+
+@patch.object(slack.task, "print_error")
+def test_fetch_conversations_to_open_failing_second_page(
+    mock_print_error: MagicMock, workspace: SlackWorkspace
+):
+    shared.active_futures = {}
+    fetched_params: List[Dict[str, object]] = []
+    fetch = paged_fetch("channels", [[{"id": channel_public_id}], None], fetched_params)
+
+    async def conversation_if_should_open(info: Dict[str, object]):
+        raise Exception("conversation_if_should_open failed")
+
+    with patch.object(workspace.api, "_fetch", fetch), patch.object(
+        workspace, "_conversation_if_should_open", conversation_if_should_open
+    ):
+        task = create_task(
+            workspace._fetch_conversations_to_open()  # pyright: ignore [reportPrivateUsage]
+        )
+
+    with pytest.raises(SlackApiError) as excinfo:
+        task.result()
+    assert excinfo.value.response == ratelimited_response
+    assert len(fetched_params) == 2
+    assert not any(
+        "conversation_if_should_open failed" in str(call)
+        for call in mock_print_error.call_args_list
+    )
@@ -1,11 +1,8 @@
-from collections import defaultdict
-
 from slack.shared import shared
 from slack.task import Future, create_task, weechat_task_cb
 
 
 def test_run_single_task():
-    shared.active_tasks = defaultdict(list)
     shared.active_futures = {}
     future = Future[str]()
 
@@ -14,15 +11,15 @@ def test_run_single_task():
         return "awaitable", result
 
     task = create_task(awaitable())
+    assert future.waiting_tasks == [task]
     weechat_task_cb(future.id, "data")
 
-    assert not shared.active_tasks
     assert not shared.active_futures
+    assert not future.waiting_tasks
     assert task.result() == ("awaitable", ("data",))
 
 
 def test_run_nested_task():
-    shared.active_tasks = defaultdict(list)
     shared.active_futures = {}
     future = Future[str]()
 
@@ -37,13 +34,11 @@ def test_run_nested_task():
     task = create_task(awaitable2())
     weechat_task_cb(future.id, "data")
 
-    assert not shared.active_tasks
     assert not shared.active_futures
     assert task.result() == ("awaitable2", ("awaitable1", ("data",)))
 
 
 def test_run_two_tasks_concurrently():
-    shared.active_tasks = defaultdict(list)
     shared.active_futures = {}
     future1 = Future[str]()
     future2 = Future[str]()
@@ -57,14 +52,12 @@ def test_run_two_tasks_concurrently():
     weechat_task_cb(future1.id, "data1")
     weechat_task_cb(future2.id, "data2")
 
-    assert not shared.active_tasks
     assert not shared.active_futures
     assert task1.result() == ("awaitable", ("data1",))
     assert task2.result() == ("awaitable", ("data2",))
 
 
 def test_task_without_await():
-    shared.active_tasks = defaultdict(list)
     shared.active_futures = {}
 
     async def fun_without_await():
@@ -75,5 +68,28 @@ def test_task_without_await():
 
     create_task(run())
 
-    assert not shared.active_tasks
     assert not shared.active_futures
+
+
+def test_cancel_task_with_waiting_task():
+    shared.active_futures = {}
+    future = Future[str]()
+
+    async def awaitable1():
+        return await future
+
+    async def awaitable2():
+        return await task1
+
+    task1 = create_task(awaitable1())
+    task2 = create_task(awaitable2())
+    assert task1.id in shared.active_futures
+
+    task1.cancel()
+    assert task1.id not in shared.active_futures
+    assert not task1.waiting_tasks
+
+    weechat_task_cb(future.id, "data")
+    assert not shared.active_futures
+    assert task1.cancelled()
+    assert not task2.done()